@@ -0,0 +1,53 @@
+from typing import Optional
+
+from sqlalchemy.orm import raiseload, selectinload, undefer
+from sqlmodel import Session, select, text
+
+from app.models import DiaryEntry, HistoricalFigure, HistoricalFigureFull
+
+# Every child collection is aggregated to JSON inside the same statement, so the whole hero page
+# is one round-trip and one plan. COALESCE turns "no rows" (NULL) into an empty list.
+_FIGURE_FULL_QUERY = text("""
+    SELECT
+        hf.*,
+        (SELECT COALESCE(json_agg(fc.text ORDER BY fc.ordinal, fc.id), '[]')
+           FROM figure_contributions fc WHERE fc.historical_figure_id = hf.id) AS major_contributions,
+        (SELECT COALESCE(json_agg(fq.text ORDER BY fq.ordinal, fq.id), '[]')
+           FROM figure_quotes fq WHERE fq.historical_figure_id = hf.id) AS famous_quotes,
+        (SELECT COALESCE(json_agg(row_to_json(de) ORDER BY de.display_order, de.id), '[]')
+           FROM diary_entries de WHERE de.historical_figure_id = hf.id) AS diary_entries,
+        (SELECT COALESCE(json_agg(row_to_json(te) ORDER BY te.display_order, te.id), '[]')
+           FROM timeline_events te WHERE te.historical_figure_id = hf.id) AS timeline_events,
+        (SELECT COALESCE(json_agg(row_to_json(fm) ORDER BY fm.display_order, fm.id), '[]')
+           FROM figure_multimedia fm WHERE fm.historical_figure_id = hf.id) AS multimedia_content
+    FROM historical_figures hf
+    WHERE hf.id = :figure_id
+""")
+
+
+def get_historical_figure_detail(session: Session, figure_id: int) -> Optional[HistoricalFigure]:
+    """Load a historical figure with everything the hero detail page renders."""
+    statement = (
+        select(HistoricalFigure)
+        .where(HistoricalFigure.id == figure_id)
+        .options(
+            undefer(HistoricalFigure.biography_summary),  # type: ignore[arg-type]
+            selectinload(HistoricalFigure.diary_entries)  # type: ignore[arg-type]
+            .undefer(DiaryEntry.entry_text)  # type: ignore[arg-type]
+            .undefer(DiaryEntry.historical_context),  # type: ignore[arg-type]
+            selectinload(HistoricalFigure.timeline_events),  # type: ignore[arg-type]
+            selectinload(HistoricalFigure.multimedia_content),  # type: ignore[arg-type]
+            selectinload(HistoricalFigure.major_contributions),  # type: ignore[arg-type]
+            selectinload(HistoricalFigure.famous_quotes),  # type: ignore[arg-type]
+            raiseload("*"),
+        )
+    )
+    return session.exec(statement).first()
+
+
+def fetch_historical_figure_full(session: Session, figure_id: int) -> Optional[HistoricalFigureFull]:
+    """Fetch a figure with diary entries, timeline, multimedia, contributions and quotes in a single query."""
+    row = session.exec(_FIGURE_FULL_QUERY, params={"figure_id": figure_id}).mappings().first()  # type: ignore[call-overload]
+    if row is None:
+        return None
+    return HistoricalFigureFull.model_validate(dict(row))
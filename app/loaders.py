@@ -0,0 +1,122 @@
+import asyncio
+from logging import getLogger
+from types import TracebackType
+from typing import Dict, Generic, Iterable, List, Optional, Set, TypeVar
+
+from sqlalchemy.orm import raiseload, undefer
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import HistoricalFigure, HistoricalPeriod, QuizLevel, VocabularyTerm
+
+logger = getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+class ModelLoader(Generic[ModelT]):
+    """DataLoader-style primary key loader.
+
+    Keys requested during one event loop tick are coalesced into a single
+    ``SELECT ... WHERE id IN (...)``; results are cached for the loader's lifetime.
+    """
+
+    def __init__(self, session: AsyncSession, model: type[ModelT], lock: asyncio.Lock) -> None:
+        self._session = session
+        self._model = model
+        self._lock = lock
+        self._cache: Dict[int, asyncio.Future[Optional[ModelT]]] = {}
+        self._pending: List[int] = []
+        # the event loop only keeps weak references to tasks; hold on to in-flight dispatches
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def load(self, key: int) -> asyncio.Future[Optional[ModelT]]:
+        # the cached future is shared by every caller of this key; each caller gets its own shield
+        # so cancelling one of them does not cancel the load for the others
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            self._pending.append(key)
+            if len(self._pending) == 1:
+                loop.call_soon(self._start_dispatch, loop)
+        return asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[int]) -> List[Optional[ModelT]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    async def drain(self) -> None:
+        """Wait until every requested key has been dispatched and resolved."""
+        while self._pending or self._tasks:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            else:
+                await asyncio.sleep(0)  # the dispatch task is created on the next loop iteration
+
+    def _start_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        try:
+            # one AsyncSession cannot run statements concurrently, so loaders sharing it take turns
+            async with self._lock:
+                # whole rows, no relationships: deferred columns cannot lazy-load on an AsyncSession,
+                # and mapper-level lazy="selectin" would add a query per batch
+                statement = (
+                    select(self._model)
+                    .where(self._model.id.in_(keys))  # type: ignore[attr-defined]
+                    .options(undefer("*"), raiseload("*"))
+                )
+                rows = (await self._session.exec(statement)).all()
+        except Exception as e:
+            logger.exception("Batch load of %s failed for keys %s", self._model.__name__, keys)
+            for key in keys:
+                future = self._cache.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_id = {row.id: row for row in rows}  # type: ignore[attr-defined]
+        for key in keys:
+            future = self._cache[key]
+            if not future.done():
+                future.set_result(by_id.get(key))
+
+
+class RequestLoaders:
+    """Per-request set of loaders; create one per page/request and drop it afterwards.
+
+    Use it as ``async with RequestLoaders(session) as loaders:`` inside the session's own block, so
+    batches still in flight finish before the session is closed.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.session_lock = asyncio.Lock()
+        self.vocabulary_terms = ModelLoader(session, VocabularyTerm, self.session_lock)
+        self.historical_figures = ModelLoader(session, HistoricalFigure, self.session_lock)
+        self.historical_periods = ModelLoader(session, HistoricalPeriod, self.session_lock)
+        self.quiz_levels = ModelLoader(session, QuizLevel, self.session_lock)
+
+    async def __aenter__(self) -> "RequestLoaders":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.drain()
+
+    async def drain(self) -> None:
+        await asyncio.gather(
+            self.vocabulary_terms.drain(),
+            self.historical_figures.drain(),
+            self.historical_periods.drain(),
+            self.quiz_levels.drain(),
+        )
@@ -1,4 +1,20 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlmodel import (
+    SQLModel,
+    Field,
+    Relationship,
+    BigInteger,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Index,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy import DDL, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
+from pydantic import BaseModel, computed_field, field_validator
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
@@ -47,59 +63,78 @@ class ARTriggerType(str, Enum):
     QR_CODE = "qr_code"
 
 
+class ActivityType(str, Enum):
+    COLLABORATIVE = "collaborative"
+    EXPLORATORY = "exploratory"
+    INDIVIDUAL = "individual"
+
+
+class TermRelationshipType(str, Enum):
+    SYNONYM = "synonym"
+    ANTONYM = "antonym"
+    RELATED_TO = "related_to"
+    PART_OF = "part_of"
+
+
+class ARSessionStatus(str, Enum):
+    STARTED = "started"
+    COMPLETED = "completed"
+    ABANDONED = "abandoned"
+
+
 # Base User Management
+# Students and teachers share one row per user: profile columns live on `users` and are left
+# NULL/default for the other role, with `is_teacher` as the discriminator. Saves the users <->
+# profile JOIN on every "who is this user" lookup.
 class User(SQLModel, table=True):
     __tablename__ = "users"  # type: ignore[assignment]
+    __table_args__ = (CheckConstraint("is_teacher OR grade IS NOT NULL", name="ck_users_student_grade"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     username: str = Field(max_length=50, unique=True, index=True)
     email: str = Field(max_length=255, unique=True, index=True)
     full_name: str = Field(max_length=100)
     is_teacher: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
-    # Relationships
-    student_profile: Optional["StudentProfile"] = Relationship(back_populates="user")
-    teacher_profile: Optional["TeacherProfile"] = Relationship(back_populates="user")
-
-
-class StudentProfile(SQLModel, table=True):
-    __tablename__ = "student_profiles"  # type: ignore[assignment]
+    school_name: Optional[str] = Field(default=None, max_length=200)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()),
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", unique=True)
-    grade: StudentGrade
-    school_name: str = Field(max_length=200)
+    # Student columns
+    grade: Optional[StudentGrade] = None
     total_points: int = Field(default=0)
     current_level: int = Field(default=1)
     streak_days: int = Field(default=0)
-    last_activity: Optional[datetime] = None
+    last_activity: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+
+    # Teacher columns
+    certification_number: Optional[str] = Field(default=None, max_length=50)
+    specialization: Optional[str] = Field(default=None, max_length=100)
 
     # Relationships
-    user: User = Relationship(back_populates="student_profile")
     quiz_attempts: List["QuizAttempt"] = Relationship(back_populates="student")
     student_badges: List["StudentBadge"] = Relationship(back_populates="student")
-    hero_diary_progress: List["HeroDiaryProgress"] = Relationship(back_populates="student")
-
-
-class TeacherProfile(SQLModel, table=True):
-    __tablename__ = "teacher_profiles"  # type: ignore[assignment]
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", unique=True)
-    school_name: str = Field(max_length=200)
-    certification_number: Optional[str] = Field(max_length=50)
-    specialization: Optional[str] = Field(max_length=100)
-
-    # Relationships
-    user: User = Relationship(back_populates="teacher_profile")
+    hero_diary_progress: List["HeroDiaryProgress"] = Relationship(
+        back_populates="student", cascade_delete=True, passive_deletes=True
+    )
     lesson_plans: List["LessonPlan"] = Relationship(back_populates="created_by")
 
 
 # 1. Learning Modules (Modul Pembelajaran)
 class LessonPlan(SQLModel, table=True):
     __tablename__ = "lesson_plans"  # type: ignore[assignment]
+    __table_args__ = (
+        Index(
+            "ix_lesson_plans_gamification_elements",
+            "gamification_elements",
+            postgresql_using="gin",
+            postgresql_ops={"gamification_elements": "jsonb_path_ops"},
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=200)
@@ -107,20 +142,43 @@ class LessonPlan(SQLModel, table=True):
     grade_level: StudentGrade
     subject: str = Field(max_length=100)
     duration_minutes: int = Field(gt=0)
-    learning_objectives: List[str] = Field(default=[], sa_column=Column(JSON))
-    curriculum_alignment: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    gamification_elements: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    created_by_id: int = Field(foreign_key="teacher_profiles.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    curriculum_alignment: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    gamification_elements: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    created_by_id: int = Field(foreign_key="users.id")
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()),
+    )
     is_validated: bool = Field(default=False)
 
     # Relationships
-    created_by: TeacherProfile = Relationship(back_populates="lesson_plans")
+    created_by: User = Relationship(back_populates="lesson_plans")
+    learning_objectives: List["LearningObjective"] = Relationship(
+        back_populates="lesson_plan",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"order_by": "[LearningObjective.ordinal, LearningObjective.id]"},
+    )
     teaching_materials: List["TeachingMaterial"] = Relationship(back_populates="lesson_plan")
     activity_sheets: List["ActivitySheet"] = Relationship(back_populates="lesson_plan")
 
 
+class LearningObjective(SQLModel, table=True):
+    __tablename__ = "learning_objectives"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_learning_objectives_plan_ordinal", "lesson_plan_id", "ordinal"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    lesson_plan_id: int = Field(foreign_key="lesson_plans.id", ondelete="CASCADE")
+    ordinal: int = Field(default=0)
+    text: str = Field(max_length=500)
+
+    # Relationships
+    lesson_plan: LessonPlan = Relationship(back_populates="learning_objectives")
+
+
 class TeachingMaterial(SQLModel, table=True):
     __tablename__ = "teaching_materials"  # type: ignore[assignment]
 
@@ -132,7 +190,9 @@ class TeachingMaterial(SQLModel, table=True):
     description: Optional[str] = Field(max_length=500)
     display_order: int = Field(default=0)
     is_validated: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
     lesson_plan: LessonPlan = Relationship(back_populates="teaching_materials")
@@ -145,12 +205,14 @@ class ActivitySheet(SQLModel, table=True):
     lesson_plan_id: int = Field(foreign_key="lesson_plans.id")
     title: str = Field(max_length=200)
     instructions: str = Field(max_length=2000)
-    activity_type: str = Field(max_length=50)  # collaborative, exploratory, individual
+    activity_type: ActivityType
     estimated_time_minutes: int = Field(gt=0)
-    materials_needed: List[str] = Field(default=[], sa_column=Column(JSON))
-    assessment_criteria: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    materials_needed: List[str] = Field(default=[], sa_column=Column(JSONB))
+    assessment_criteria: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
     file_path: Optional[str] = Field(max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
     lesson_plan: LessonPlan = Relationship(back_populates="activity_sheets")
@@ -176,6 +238,12 @@ class HistoricalPeriod(SQLModel, table=True):
 
 class QuizLevel(SQLModel, table=True):
     __tablename__ = "quiz_levels"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_levels_period_number", "historical_period_id", "level_number"),
+        # "which levels can this student unlock now?" - per period, and across all periods
+        Index("ix_levels_period_unlock", "historical_period_id", "unlock_points_required"),
+        Index("ix_quiz_levels_unlock", "unlock_points_required", postgresql_using="brin"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     historical_period_id: int = Field(foreign_key="historical_periods.id")
@@ -189,15 +257,21 @@ class QuizLevel(SQLModel, table=True):
 
     # Relationships
     historical_period: HistoricalPeriod = Relationship(back_populates="quiz_levels")
-    questions: List["QuizQuestion"] = Relationship(back_populates="quiz_level")
+    questions: List["QuizQuestion"] = Relationship(
+        back_populates="quiz_level",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"lazy": "selectin", "order_by": "[QuizQuestion.display_order, QuizQuestion.id]"},
+    )
     quiz_attempts: List["QuizAttempt"] = Relationship(back_populates="quiz_level")
 
 
 class QuizQuestion(SQLModel, table=True):
     __tablename__ = "quiz_questions"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_questions_level_order", "quiz_level_id", "display_order"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    quiz_level_id: int = Field(foreign_key="quiz_levels.id")
+    quiz_level_id: int = Field(foreign_key="quiz_levels.id", ondelete="CASCADE")
     question_text: str = Field(max_length=1000)
     question_type: QuestionType
     difficulty: QuestionDifficulty
@@ -205,45 +279,79 @@ class QuizQuestion(SQLModel, table=True):
     explanation: str = Field(max_length=1000)
     media_url: Optional[str] = Field(max_length=500)
     correct_answer: str = Field(max_length=500)
-    answer_options: Optional[List[str]] = Field(default=[], sa_column=Column(JSON))
     display_order: int = Field(default=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
     quiz_level: QuizLevel = Relationship(back_populates="questions")
+    answer_options: List["AnswerOption"] = Relationship(
+        back_populates="question",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"order_by": "[AnswerOption.ordinal, AnswerOption.id]"},
+    )
     student_answers: List["StudentAnswer"] = Relationship(back_populates="question")
 
 
+class AnswerOption(SQLModel, table=True):
+    __tablename__ = "answer_options"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_answer_options_question_ordinal", "question_id", "ordinal"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    question_id: int = Field(foreign_key="quiz_questions.id", ondelete="CASCADE")
+    ordinal: int = Field(default=0)
+    text: str = Field(max_length=500)
+
+    # Relationships
+    question: QuizQuestion = Relationship(back_populates="answer_options")
+
+
 class QuizAttempt(SQLModel, table=True):
     __tablename__ = "quiz_attempts"  # type: ignore[assignment]
+    __table_args__ = (
+        # also serves (student_id, quiz_level_id) lookups and the next-attempt-number MAX()
+        UniqueConstraint("student_id", "quiz_level_id", "attempt_number", name="uq_attempt"),
+        Index("ix_active_attempts", "student_id", "quiz_level_id", postgresql_where=text("is_completed = false")),
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: int = Field(foreign_key="student_profiles.id")
+    id: Optional[int] = Field(default=None, primary_key=True, sa_type=BigInteger)  # high-volume table
+    student_id: int = Field(foreign_key="users.id")
     quiz_level_id: int = Field(foreign_key="quiz_levels.id")
     attempt_number: int = Field(gt=0)
-    started_at: datetime = Field(default_factory=datetime.utcnow)
-    completed_at: Optional[datetime] = None
+    started_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
+    completed_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
     score: Optional[int] = Field(default=0)
     total_points_earned: int = Field(default=0)
     is_completed: bool = Field(default=False)
     is_passed: bool = Field(default=False)
 
     # Relationships
-    student: StudentProfile = Relationship(back_populates="quiz_attempts")
+    student: User = Relationship(back_populates="quiz_attempts")
     quiz_level: QuizLevel = Relationship(back_populates="quiz_attempts")
-    student_answers: List["StudentAnswer"] = Relationship(back_populates="quiz_attempt")
+    student_answers: List["StudentAnswer"] = Relationship(
+        back_populates="quiz_attempt",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"lazy": "selectin"},
+    )
 
 
 class StudentAnswer(SQLModel, table=True):
     __tablename__ = "student_answers"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    quiz_attempt_id: int = Field(foreign_key="quiz_attempts.id")
+    id: Optional[int] = Field(default=None, primary_key=True, sa_type=BigInteger)  # high-volume table
+    quiz_attempt_id: int = Field(foreign_key="quiz_attempts.id", ondelete="CASCADE", index=True, sa_type=BigInteger)
     question_id: int = Field(foreign_key="quiz_questions.id")
     student_answer: str = Field(max_length=1000)
     is_correct: bool
     points_earned: int = Field(default=0)
-    answered_at: datetime = Field(default_factory=datetime.utcnow)
+    answered_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
     time_taken_seconds: Optional[int] = None
 
     # Relationships
@@ -253,13 +361,16 @@ class StudentAnswer(SQLModel, table=True):
 
 class Badge(SQLModel, table=True):
     __tablename__ = "badges"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_badges_criteria", "criteria", postgresql_using="gin", postgresql_ops={"criteria": "jsonb_path_ops"}),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100, unique=True)
     description: str = Field(max_length=500)
     badge_type: BadgeType
     icon_url: str = Field(max_length=500)
-    criteria: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    criteria: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
     points_reward: int = Field(default=0)
     is_active: bool = Field(default=True)
 
@@ -269,15 +380,18 @@ class Badge(SQLModel, table=True):
 
 class StudentBadge(SQLModel, table=True):
     __tablename__ = "student_badges"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_student_badges_student_earned", "student_id", "earned_at"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: int = Field(foreign_key="student_profiles.id")
+    student_id: int = Field(foreign_key="users.id")
     badge_id: int = Field(foreign_key="badges.id")
-    earned_at: datetime = Field(default_factory=datetime.utcnow)
-    progress_data: Optional[Dict[str, Any]] = Field(default={}, sa_column=Column(JSON))
+    earned_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
+    progress_data: Optional[Dict[str, Any]] = Field(default={}, sa_column=Column(JSONB))
 
     # Relationships
-    student: StudentProfile = Relationship(back_populates="student_badges")
+    student: User = Relationship(back_populates="student_badges")
     badge: Badge = Relationship(back_populates="student_badges")
 
 
@@ -295,24 +409,35 @@ class VocabularyTerm(SQLModel, table=True):
     usage_example: Optional[str] = Field(max_length=1000)
     difficulty_level: QuestionDifficulty
     grade_level: StudentGrade
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
     historical_period: Optional[HistoricalPeriod] = Relationship(back_populates="vocabulary_terms")
-    visual_content: List["VocabularyVisual"] = Relationship(back_populates="vocabulary_term")
+    visual_content: List["VocabularyVisual"] = Relationship(
+        back_populates="vocabulary_term", cascade_delete=True, passive_deletes=True
+    )
     term_connections: List["TermConnection"] = Relationship(
-        back_populates="source_term", sa_relationship_kwargs={"foreign_keys": "TermConnection.source_term_id"}
+        back_populates="source_term",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"foreign_keys": "TermConnection.source_term_id"},
     )
     connected_from: List["TermConnection"] = Relationship(
-        back_populates="target_term", sa_relationship_kwargs={"foreign_keys": "TermConnection.target_term_id"}
+        back_populates="target_term",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"foreign_keys": "TermConnection.target_term_id"},
     )
 
 
 class VocabularyVisual(SQLModel, table=True):
     __tablename__ = "vocabulary_visuals"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_visuals_term_order", "vocabulary_term_id", "display_order"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    vocabulary_term_id: int = Field(foreign_key="vocabulary_terms.id")
+    vocabulary_term_id: int = Field(foreign_key="vocabulary_terms.id", ondelete="CASCADE")
     media_type: MediaType
     media_url: str = Field(max_length=500)
     caption: Optional[str] = Field(max_length=500)
@@ -327,9 +452,9 @@ class TermConnection(SQLModel, table=True):
     __tablename__ = "term_connections"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    source_term_id: int = Field(foreign_key="vocabulary_terms.id")
-    target_term_id: int = Field(foreign_key="vocabulary_terms.id")
-    relationship_type: str = Field(max_length=50)  # synonym, antonym, related_to, part_of
+    source_term_id: int = Field(foreign_key="vocabulary_terms.id", ondelete="CASCADE", index=True)
+    target_term_id: int = Field(foreign_key="vocabulary_terms.id", ondelete="CASCADE", index=True)
+    relationship_type: TermRelationshipType
     description: Optional[str] = Field(max_length=500)
     strength: int = Field(default=1, ge=1, le=5)  # Connection strength 1-5
 
@@ -354,27 +479,77 @@ class HistoricalFigure(SQLModel, table=True):
     birth_place: Optional[str] = Field(max_length=200)
     occupation: Optional[str] = Field(max_length=100)
     biography_summary: str = Field(max_length=2000)
-    major_contributions: List[str] = Field(default=[], sa_column=Column(JSON))
-    famous_quotes: List[str] = Field(default=[], sa_column=Column(JSON))
     portrait_url: Optional[str] = Field(max_length=500)
     is_featured: bool = Field(default=False)
     reading_level: StudentGrade
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
     historical_period: Optional[HistoricalPeriod] = Relationship(back_populates="historical_figures")
-    diary_entries: List["DiaryEntry"] = Relationship(back_populates="historical_figure")
-    timeline_events: List["TimelineEvent"] = Relationship(back_populates="historical_figure")
-    multimedia_content: List["FigureMultimedia"] = Relationship(back_populates="historical_figure")
-    hero_diary_progress: List["HeroDiaryProgress"] = Relationship(back_populates="historical_figure")
+    major_contributions: List["FigureContribution"] = Relationship(
+        back_populates="historical_figure",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"order_by": "[FigureContribution.ordinal, FigureContribution.id]"},
+    )
+    famous_quotes: List["FigureQuote"] = Relationship(
+        back_populates="historical_figure",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"order_by": "[FigureQuote.ordinal, FigureQuote.id]"},
+    )
+    diary_entries: List["DiaryEntry"] = Relationship(
+        back_populates="historical_figure",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"lazy": "selectin", "order_by": "[DiaryEntry.display_order, DiaryEntry.id]"},
+    )
+    timeline_events: List["TimelineEvent"] = Relationship(
+        back_populates="historical_figure", cascade_delete=True, passive_deletes=True
+    )
+    multimedia_content: List["FigureMultimedia"] = Relationship(
+        back_populates="historical_figure", cascade_delete=True, passive_deletes=True
+    )
+    hero_diary_progress: List["HeroDiaryProgress"] = Relationship(
+        back_populates="historical_figure", cascade_delete=True, passive_deletes=True
+    )
     ar_models: List["ARModel"] = Relationship(back_populates="historical_figure")
 
 
+class FigureContribution(SQLModel, table=True):
+    __tablename__ = "figure_contributions"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_figure_contributions_figure_ordinal", "historical_figure_id", "ordinal"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    historical_figure_id: int = Field(foreign_key="historical_figures.id", ondelete="CASCADE")
+    ordinal: int = Field(default=0)
+    text: str = Field(max_length=500)
+
+    # Relationships
+    historical_figure: HistoricalFigure = Relationship(back_populates="major_contributions")
+
+
+class FigureQuote(SQLModel, table=True):
+    __tablename__ = "figure_quotes"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_figure_quotes_figure_ordinal", "historical_figure_id", "ordinal"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    historical_figure_id: int = Field(foreign_key="historical_figures.id", ondelete="CASCADE")
+    ordinal: int = Field(default=0)
+    text: str = Field(max_length=1000)
+
+    # Relationships
+    historical_figure: HistoricalFigure = Relationship(back_populates="famous_quotes")
+
+
 class DiaryEntry(SQLModel, table=True):
     __tablename__ = "diary_entries"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_diary_figure_order", "historical_figure_id", "display_order"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    historical_figure_id: int = Field(foreign_key="historical_figures.id")
+    historical_figure_id: int = Field(foreign_key="historical_figures.id", ondelete="CASCADE")
     title: str = Field(max_length=200)
     entry_text: str = Field(max_length=5000)
     entry_date: Optional[datetime] = None  # Historical date (if known)
@@ -382,18 +557,39 @@ class DiaryEntry(SQLModel, table=True):
     emotional_tone: Optional[str] = Field(max_length=50)
     display_order: int = Field(default=0)
     is_fictional: bool = Field(default=True)  # Most entries will be interpretive
-    sources: Optional[List[str]] = Field(default=[], sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
     historical_figure: HistoricalFigure = Relationship(back_populates="diary_entries")
+    sources: List["DiaryEntrySource"] = Relationship(
+        back_populates="diary_entry",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"order_by": "[DiaryEntrySource.ordinal, DiaryEntrySource.id]"},
+    )
+
+
+class DiaryEntrySource(SQLModel, table=True):
+    __tablename__ = "diary_entry_sources"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_diary_entry_sources_entry_ordinal", "diary_entry_id", "ordinal"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    diary_entry_id: int = Field(foreign_key="diary_entries.id", ondelete="CASCADE")
+    ordinal: int = Field(default=0)
+    text: str = Field(max_length=500)
+
+    # Relationships
+    diary_entry: DiaryEntry = Relationship(back_populates="sources")
 
 
 class TimelineEvent(SQLModel, table=True):
     __tablename__ = "timeline_events"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_timeline_figure_year", "historical_figure_id", "event_year"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    historical_figure_id: int = Field(foreign_key="historical_figures.id")
+    historical_figure_id: int = Field(foreign_key="historical_figures.id", ondelete="CASCADE")
     title: str = Field(max_length=200)
     description: str = Field(max_length=1000)
     event_date: Optional[datetime] = None
@@ -410,7 +606,7 @@ class FigureMultimedia(SQLModel, table=True):
     __tablename__ = "figure_multimedia"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    historical_figure_id: int = Field(foreign_key="historical_figures.id")
+    historical_figure_id: int = Field(foreign_key="historical_figures.id", ondelete="CASCADE", index=True)
     media_type: MediaType
     media_url: str = Field(max_length=500)
     title: str = Field(max_length=200)
@@ -423,38 +619,71 @@ class FigureMultimedia(SQLModel, table=True):
     historical_figure: HistoricalFigure = Relationship(back_populates="multimedia_content")
 
 
+class FavoriteDiaryEntry(SQLModel, table=True):
+    __tablename__ = "favorite_diary_entries"  # type: ignore[assignment]
+
+    progress_id: int = Field(foreign_key="hero_diary_progress.id", ondelete="CASCADE", primary_key=True)
+    diary_entry_id: int = Field(foreign_key="diary_entries.id", ondelete="CASCADE", index=True, primary_key=True)
+
+
 class HeroDiaryProgress(SQLModel, table=True):
     __tablename__ = "hero_diary_progress"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: int = Field(foreign_key="student_profiles.id")
-    historical_figure_id: int = Field(foreign_key="historical_figures.id")
+    student_id: int = Field(foreign_key="users.id", ondelete="CASCADE", index=True)
+    historical_figure_id: int = Field(foreign_key="historical_figures.id", ondelete="CASCADE", index=True)
     entries_read: int = Field(default=0)
     total_entries: int = Field(default=0)
-    completion_percentage: Decimal = Field(default=Decimal("0"), max_digits=5, decimal_places=2)
-    last_accessed: datetime = Field(default_factory=datetime.utcnow)
-    favorite_entries: List[int] = Field(default=[], sa_column=Column(JSON))
+    completion_basis_points: int = Field(
+        default=0, ge=0, le=10000, sa_column_kwargs={"server_default": text("0")}
+    )  # 1 bp = 0.01%
+    last_accessed: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
     notes: Optional[str] = Field(max_length=2000)
 
     # Relationships
-    student: StudentProfile = Relationship(back_populates="hero_diary_progress")
+    student: User = Relationship(back_populates="hero_diary_progress")
     historical_figure: HistoricalFigure = Relationship(back_populates="hero_diary_progress")
+    favorite_entries: List[DiaryEntry] = Relationship(
+        link_model=FavoriteDiaryEntry,
+        sa_relationship_kwargs={"order_by": "[DiaryEntry.display_order, DiaryEntry.id]"},
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def completion_percentage(self) -> Decimal:
+        """Read-only view of completion_basis_points; table models drop unknown constructor kwargs, so
+        HeroDiaryProgress(completion_percentage=50) stores 0 - set completion_basis_points instead."""
+        return Decimal(self.completion_basis_points).scaleb(-2)
 
 
 # 5. Augmented Reality (AR)
 class ARTrigger(SQLModel, table=True):
     __tablename__ = "ar_triggers"  # type: ignore[assignment]
+    __table_args__ = (
+        Index(
+            "ix_ar_triggers_recognition_data",
+            "recognition_data",
+            postgresql_using="gin",
+            postgresql_ops={"recognition_data": "jsonb_path_ops"},
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     trigger_type: ARTriggerType
     trigger_name: str = Field(max_length=100)
     description: str = Field(max_length=500)
-    recognition_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))  # Image features, QR data, etc.
+    recognition_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))  # Image features, QR data, etc.
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
-    ar_experiences: List["ARExperience"] = Relationship(back_populates="ar_trigger")
+    ar_experiences: List["ARExperience"] = Relationship(
+        back_populates="ar_trigger", cascade_delete=True, passive_deletes=True
+    )
 
 
 class ARModel(SQLModel, table=True):
@@ -466,27 +695,48 @@ class ARModel(SQLModel, table=True):
     model_file_path: str = Field(max_length=500)
     texture_file_path: Optional[str] = Field(max_length=500)
     animation_file_path: Optional[str] = Field(max_length=500)
-    scale_factor: Decimal = Field(default=Decimal("1.0"), max_digits=5, decimal_places=3)
-    animation_triggers: List[str] = Field(default=[], sa_column=Column(JSON))
-    interaction_points: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    file_size_mb: Optional[Decimal] = Field(max_digits=8, decimal_places=2)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    scale_factor_millis: int = Field(
+        default=1000, gt=0, sa_column_kwargs={"server_default": text("1000")}
+    )  # 1000 = 1.0x
+    animation_triggers: List[str] = Field(default=[], sa_column=Column(JSONB))
+    interaction_points: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    file_size_kb: Optional[int] = Field(ge=0)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
 
     # Relationships
     historical_figure: Optional[HistoricalFigure] = Relationship(back_populates="ar_models")
-    ar_experiences: List["ARExperience"] = Relationship(back_populates="ar_model")
+    ar_experiences: List["ARExperience"] = Relationship(
+        back_populates="ar_model", cascade_delete=True, passive_deletes=True
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def scale_factor(self) -> Decimal:
+        """Read-only view of scale_factor_millis; table models drop unknown constructor kwargs, so
+        ARModel(scale_factor=2) keeps 1000 - set scale_factor_millis instead."""
+        return Decimal(self.scale_factor_millis).scaleb(-3)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def file_size_mb(self) -> Optional[Decimal]:
+        """Read-only view of file_size_kb, rounded to 0.01 MB."""
+        if self.file_size_kb is None:
+            return None
+        return (Decimal(self.file_size_kb) / 1024).quantize(Decimal("0.01"))
 
 
 class ARExperience(SQLModel, table=True):
     __tablename__ = "ar_experiences"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    ar_trigger_id: int = Field(foreign_key="ar_triggers.id")
-    ar_model_id: int = Field(foreign_key="ar_models.id")
+    ar_trigger_id: int = Field(foreign_key="ar_triggers.id", ondelete="CASCADE", index=True)
+    ar_model_id: int = Field(foreign_key="ar_models.id", ondelete="CASCADE", index=True)
     experience_name: str = Field(max_length=100)
     description: str = Field(max_length=500)
-    interactive_elements: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    storytelling_content: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    interactive_elements: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    storytelling_content: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
     audio_narration_url: Optional[str] = Field(max_length=500)
     duration_seconds: Optional[int] = None
     grade_level: StudentGrade
@@ -495,56 +745,137 @@ class ARExperience(SQLModel, table=True):
     # Relationships
     ar_trigger: ARTrigger = Relationship(back_populates="ar_experiences")
     ar_model: ARModel = Relationship(back_populates="ar_experiences")
-    ar_sessions: List["ARSession"] = Relationship(back_populates="ar_experience")
+    ar_sessions: List["ARSession"] = Relationship(
+        back_populates="ar_experience", cascade_delete=True, passive_deletes=True
+    )
 
 
 class ARSession(SQLModel, table=True):
     __tablename__ = "ar_sessions"  # type: ignore[assignment]
+    __table_args__ = (
+        Index(
+            "ix_ar_sessions_device_info",
+            "device_info",
+            postgresql_using="gin",
+            postgresql_ops={"device_info": "jsonb_path_ops"},
+        ),
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: Optional[int] = Field(foreign_key="student_profiles.id")  # Optional for anonymous usage
-    ar_experience_id: int = Field(foreign_key="ar_experiences.id")
-    session_start: datetime = Field(default_factory=datetime.utcnow)
-    session_end: Optional[datetime] = None
+    id: Optional[int] = Field(default=None, primary_key=True, sa_type=BigInteger)  # high-volume table
+    student_id: Optional[int] = Field(foreign_key="users.id")  # Optional for anonymous usage
+    ar_experience_id: int = Field(foreign_key="ar_experiences.id", ondelete="CASCADE", index=True)
+    session_start: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
+    session_end: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
     duration_seconds: Optional[int] = None
     interactions_count: int = Field(default=0)
-    completion_status: str = Field(default="started")  # started, completed, abandoned
-    device_info: Optional[Dict[str, Any]] = Field(default={}, sa_column=Column(JSON))
+    completion_status: ARSessionStatus = Field(default=ARSessionStatus.STARTED)
+    device_info: Optional[Dict[str, Any]] = Field(default={}, sa_column=Column(JSONB))
 
     # Relationships
-    student: Optional[StudentProfile] = Relationship()
+    student: Optional[User] = Relationship()
     ar_experience: ARExperience = Relationship(back_populates="ar_sessions")
 
 
-# Non-persistent schemas for validation and API
-class UserCreate(SQLModel, table=False):
+# Heavy text/JSON columns are left out of the default SELECT so list views only fetch what they render.
+# Detail views load them up front with .options(undefer(Model.column)); otherwise they load on first access.
+def _defer_columns(model: type[SQLModel], *column_names: str) -> None:
+    table = model.__table__  # type: ignore[attr-defined]
+    for column_name in column_names:
+        setattr(model, column_name, deferred(table.c[column_name]))
+
+
+_defer_columns(LessonPlan, "description", "curriculum_alignment", "gamification_elements")
+_defer_columns(QuizQuestion, "explanation")
+_defer_columns(Badge, "criteria")
+_defer_columns(VocabularyTerm, "definition", "etymology", "usage_example")
+_defer_columns(HistoricalFigure, "biography_summary")
+_defer_columns(DiaryEntry, "entry_text", "historical_context")
+_defer_columns(ARModel, "interaction_points")
+
+
+# users.total_points, streak_days and last_activity are maintained by a trigger on quiz_attempts, so
+# concurrent completions cannot lose updates and application code never writes them. There are no
+# migrations: the function and trigger are installed whenever the quiz_attempts table is created.
+_UPDATE_STUDENT_POINTS_FUNCTION = DDL(
+    """
+    CREATE OR REPLACE FUNCTION update_student_points() RETURNS trigger AS $$
+    BEGIN
+        -- skip no-op point changes: opening an attempt must not write or row-lock the users row
+        IF TG_OP = 'INSERT' THEN
+            IF NEW.total_points_earned IS DISTINCT FROM 0 THEN
+                UPDATE users SET total_points = total_points + NEW.total_points_earned WHERE id = NEW.student_id;
+            END IF;
+        ELSIF TG_OP = 'DELETE' THEN
+            IF OLD.total_points_earned IS DISTINCT FROM 0 THEN
+                UPDATE users SET total_points = total_points - OLD.total_points_earned WHERE id = OLD.student_id;
+            END IF;
+        ELSIF OLD.total_points_earned IS DISTINCT FROM NEW.total_points_earned
+                OR OLD.student_id IS DISTINCT FROM NEW.student_id THEN
+            UPDATE users SET total_points = total_points - OLD.total_points_earned WHERE id = OLD.student_id;
+            UPDATE users SET total_points = total_points + NEW.total_points_earned WHERE id = NEW.student_id;
+        END IF;
+        -- a streak day counts once per calendar day; a gap of more than one day starts over
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.completed_at IS NOT NULL
+                AND (TG_OP = 'INSERT' OR OLD.completed_at IS NULL) THEN
+            UPDATE users
+            SET streak_days = CASE
+                    WHEN last_activity IS NULL THEN 1
+                    WHEN NEW.completed_at::date <= last_activity::date THEN GREATEST(streak_days, 1)
+                    WHEN NEW.completed_at::date = last_activity::date + 1 THEN streak_days + 1
+                    ELSE 1
+                END,
+                last_activity = GREATEST(last_activity, NEW.completed_at)
+            WHERE id = NEW.student_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+_UPDATE_STUDENT_POINTS_TRIGGER = DDL(
+    """
+    CREATE TRIGGER trg_quiz_attempts_student_points
+    AFTER INSERT OR DELETE OR UPDATE OF student_id, total_points_earned, completed_at ON quiz_attempts
+    FOR EACH ROW EXECUTE FUNCTION update_student_points()
+    """
+)
+_quiz_attempts_table = QuizAttempt.__table__  # type: ignore[attr-defined]
+event.listen(_quiz_attempts_table, "after_create", _UPDATE_STUDENT_POINTS_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(_quiz_attempts_table, "after_create", _UPDATE_STUDENT_POINTS_TRIGGER.execute_if(dialect="postgresql"))
+
+
+# Non-persistent schemas for validation and API. These are plain pydantic models: they never touch
+# the database, and skipping SQLModel's table machinery makes per-request construction much cheaper.
+class UserCreate(BaseModel):
     username: str = Field(max_length=50)
     email: str = Field(max_length=255)
     full_name: str = Field(max_length=100)
     is_teacher: bool = Field(default=False)
 
 
-class StudentCreate(SQLModel, table=False):
+class StudentCreate(BaseModel):
     grade: StudentGrade
     school_name: str = Field(max_length=200)
 
 
-class TeacherCreate(SQLModel, table=False):
+class TeacherCreate(BaseModel):
     school_name: str = Field(max_length=200)
     certification_number: Optional[str] = Field(max_length=50)
     specialization: Optional[str] = Field(max_length=100)
 
 
-class QuizAttemptCreate(SQLModel, table=False):
+class QuizAttemptCreate(BaseModel):
     quiz_level_id: int
 
 
-class StudentAnswerCreate(SQLModel, table=False):
+class StudentAnswerCreate(BaseModel):
     question_id: int
     student_answer: str = Field(max_length=1000)
 
 
-class VocabularyTermCreate(SQLModel, table=False):
+class VocabularyTermCreate(BaseModel):
     historical_period_id: Optional[int] = None
     term: str = Field(max_length=100)
     definition: str = Field(max_length=2000)
@@ -553,12 +884,82 @@ class VocabularyTermCreate(SQLModel, table=False):
     grade_level: StudentGrade
 
 
-class HeroDiaryProgressUpdate(SQLModel, table=False):
+class HeroDiaryProgressUpdate(BaseModel):
     entries_read: Optional[int] = None
     notes: Optional[str] = Field(max_length=2000)
     favorite_entries: Optional[List[int]] = None
 
 
-class ARSessionCreate(SQLModel, table=False):
+class ARSessionCreate(BaseModel):
     ar_experience_id: int
     device_info: Optional[Dict[str, Any]] = None
+
+
+# Read schemas filled from raw SQL/JSON rather than ORM rows. Native ENUM columns hold the member
+# *name* (that is what SQLAlchemy writes), so map labels back to members before value validation.
+def _enum_from_label(enum_cls: type[Enum], value: Any) -> Any:
+    if isinstance(value, str) and value in enum_cls.__members__:
+        return enum_cls[value]
+    return value
+
+
+class DiaryEntryRead(BaseModel):
+    id: int
+    title: str
+    entry_text: str
+    entry_date: Optional[datetime] = None
+    historical_context: str
+    emotional_tone: Optional[str] = None
+    display_order: int
+    is_fictional: bool
+
+
+class TimelineEventRead(BaseModel):
+    id: int
+    title: str
+    description: str
+    event_date: Optional[datetime] = None
+    event_year: Optional[int] = None
+    importance_level: int
+    location: Optional[str] = None
+    display_order: int
+
+
+class FigureMultimediaRead(BaseModel):
+    id: int
+    media_type: MediaType
+    media_url: str
+    title: str
+    description: Optional[str] = None
+    source_attribution: Optional[str] = None
+    display_order: int
+    is_primary: bool
+
+    @field_validator("media_type", mode="before")
+    @classmethod
+    def _media_type_from_label(cls, value: Any) -> Any:
+        return _enum_from_label(MediaType, value)
+
+
+class HistoricalFigureFull(BaseModel):
+    id: int
+    historical_period_id: Optional[int] = None
+    name: str
+    birth_year: Optional[int] = None
+    death_year: Optional[int] = None
+    birth_place: Optional[str] = None
+    occupation: Optional[str] = None
+    biography_summary: str
+    portrait_url: Optional[str] = None
+    is_featured: bool
+    reading_level: StudentGrade
+    major_contributions: List[str] = Field(default=[])
+    famous_quotes: List[str] = Field(default=[])
+    diary_entries: List[DiaryEntryRead] = Field(default=[])
+    timeline_events: List[TimelineEventRead] = Field(default=[])
+    multimedia_content: List[FigureMultimediaRead] = Field(default=[])
+
+    @field_validator("reading_level", mode="before")
+    @classmethod
+    def _reading_level_from_label(cls, value: Any) -> Any:
+        return _enum_from_label(StudentGrade, value)
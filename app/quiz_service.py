@@ -0,0 +1,176 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Union
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import Session, col, func, select
+
+from app.models import QuizAttempt, QuizLevel, QuizQuestion, StudentAnswer, StudentAnswerCreate
+
+PASSING_SCORE_PERCENT = 70
+
+_STUDENT_ANSWERS = TypeAdapter(List[StudentAnswerCreate])
+# refresh(attempt) would also re-run the mapper-level selectin load of student_answers
+_ATTEMPT_COLUMNS = [attr.key for attr in inspect(QuizAttempt).column_attrs]
+
+
+def get_quiz_level_with_questions(session: Session, quiz_level_id: int) -> Optional[QuizLevel]:
+    """Load a quiz level for rendering: ordered questions and their answer options, nothing else."""
+    statement = (
+        select(QuizLevel)
+        .where(QuizLevel.id == quiz_level_id)
+        .options(
+            selectinload(QuizLevel.questions).selectinload(QuizQuestion.answer_options),  # type: ignore[arg-type]
+            raiseload("*"),
+        )
+    )
+    return session.exec(statement).first()
+
+
+def list_unlocked_levels(session: Session, points: int, historical_period_id: Optional[int] = None) -> List[QuizLevel]:
+    """Levels a student with ``points`` total points has unlocked, without their questions."""
+    statement = select(QuizLevel).where(QuizLevel.unlock_points_required <= points)
+    if historical_period_id is not None:
+        statement = statement.where(QuizLevel.historical_period_id == historical_period_id)
+    statement = statement.order_by(col(QuizLevel.historical_period_id), col(QuizLevel.level_number)).options(
+        raiseload("*")
+    )
+    return list(session.exec(statement).all())
+
+
+def get_quiz_attempt_with_answers(session: Session, quiz_attempt_id: int) -> Optional[QuizAttempt]:
+    """Load a quiz attempt with its answers and the question each answer belongs to."""
+    statement = (
+        select(QuizAttempt)
+        .where(QuizAttempt.id == quiz_attempt_id)
+        .options(
+            selectinload(QuizAttempt.student_answers)  # type: ignore[arg-type]
+            .selectinload(StudentAnswer.question)  # type: ignore[arg-type]
+            .undefer(QuizQuestion.explanation),  # type: ignore[arg-type]
+            raiseload("*"),
+        )
+    )
+    return session.exec(statement).first()
+
+
+def get_in_progress_attempt(session: Session, student_id: int, quiz_level_id: int) -> Optional[QuizAttempt]:
+    statement = (
+        select(QuizAttempt)
+        .where(
+            QuizAttempt.student_id == student_id,
+            QuizAttempt.quiz_level_id == quiz_level_id,
+            QuizAttempt.is_completed == False,  # noqa: E712 - must match the ix_active_attempts predicate
+        )
+        .options(raiseload("*"))
+    )
+    return session.exec(statement).first()
+
+
+def start_quiz_attempt(session: Session, student_id: int, quiz_level_id: int) -> QuizAttempt:
+    """Resume the student's unfinished attempt on a level, or open the next numbered one."""
+    in_progress = get_in_progress_attempt(session, student_id, quiz_level_id)
+    if in_progress is not None:
+        return in_progress
+
+    # only the limit is needed; loading the QuizLevel entity would also selectin-load its questions
+    level = session.exec(select(QuizLevel.id, QuizLevel.max_attempts).where(QuizLevel.id == quiz_level_id)).first()
+    if level is None:
+        raise ValueError(f"Quiz level {quiz_level_id} not found")
+    _, max_attempts = level
+
+    last_number = session.exec(
+        select(func.max(QuizAttempt.attempt_number)).where(
+            QuizAttempt.student_id == student_id, QuizAttempt.quiz_level_id == quiz_level_id
+        )
+    ).first()
+    next_number = (last_number or 0) + 1
+    if max_attempts is not None and next_number > max_attempts:
+        raise ValueError(f"No attempts left on quiz level {quiz_level_id}")
+
+    attempt = QuizAttempt(student_id=student_id, quiz_level_id=quiz_level_id, attempt_number=next_number)
+    session.add(attempt)
+    try:
+        session.commit()
+    except IntegrityError:
+        # a concurrent request took this attempt number (uq_attempt); use the attempt it opened
+        session.rollback()
+        in_progress = get_in_progress_attempt(session, student_id, quiz_level_id)
+        if in_progress is None:
+            raise
+        return in_progress
+    session.refresh(attempt, attribute_names=_ATTEMPT_COLUMNS)
+    return attempt
+
+
+def parse_student_answers(payload: Union[str, bytes]) -> List[StudentAnswerCreate]:
+    """Validate a raw JSON answer list in one pass, without an intermediate json.loads() dict tree."""
+    return _STUDENT_ANSWERS.validate_json(payload)
+
+
+def submit_quiz_answers(session: Session, quiz_attempt_id: int, answers: List[StudentAnswerCreate]) -> QuizAttempt:
+    """Grade a finished attempt and store all answers in one batched INSERT."""
+    question_ids = [answer.question_id for answer in answers]
+    if len(set(question_ids)) != len(question_ids):
+        raise ValueError(f"Quiz attempt {quiz_attempt_id} has more than one answer for the same question")
+
+    # row lock: a concurrent submit of the same attempt waits here and then sees is_completed
+    attempt = session.exec(
+        select(QuizAttempt)
+        .where(QuizAttempt.id == quiz_attempt_id)
+        .with_for_update()
+        .options(raiseload("*"))
+        .execution_options(populate_existing=True)
+    ).first()
+    if attempt is None:
+        session.rollback()
+        raise ValueError(f"Quiz attempt {quiz_attempt_id} not found")
+    if attempt.is_completed:
+        session.rollback()  # release the row lock
+        raise ValueError(f"Quiz attempt {quiz_attempt_id} is already completed")
+
+    questions = {
+        question_id: (correct_answer, points_value)
+        for question_id, correct_answer, points_value in session.exec(
+            select(QuizQuestion.id, QuizQuestion.correct_answer, QuizQuestion.points_value).where(
+                QuizQuestion.quiz_level_id == attempt.quiz_level_id
+            )
+        )
+    }
+
+    rows = []
+    for answer in answers:
+        question = questions.get(answer.question_id)
+        if question is None:
+            quiz_level_id = attempt.quiz_level_id
+            session.rollback()  # release the row lock
+            raise ValueError(f"Question {answer.question_id} does not belong to quiz level {quiz_level_id}")
+        correct_answer, points_value = question
+        is_correct = answer.student_answer.strip().casefold() == correct_answer.strip().casefold()
+        rows.append(
+            {
+                "quiz_attempt_id": quiz_attempt_id,
+                "question_id": answer.question_id,
+                "student_answer": answer.student_answer,
+                "is_correct": is_correct,
+                "points_earned": points_value if is_correct else 0,
+            }
+        )
+
+    # executemany: one round-trip for the whole quiz; answered_at comes from the column's server default
+    if rows:
+        session.execute(insert(StudentAnswer), rows)
+
+    points_earned = sum(row["points_earned"] for row in rows)
+    correct_count = sum(1 for row in rows if row["is_correct"])
+    attempt.score = round(100 * correct_count / len(questions)) if questions else 0
+    attempt.total_points_earned = points_earned
+    attempt.is_completed = True
+    attempt.is_passed = attempt.score >= PASSING_SCORE_PERCENT
+    attempt.completed_at = datetime.now(timezone.utc)
+
+    # users.total_points / streak_days / last_activity follow from trg_quiz_attempts_student_points
+    session.commit()
+    session.refresh(attempt, attribute_names=_ATTEMPT_COLUMNS)
+    return attempt
@@ -0,0 +1,108 @@
+"""Read-through cache for read-mostly reference tables (historical periods, badges).
+
+Cached objects are detached from any session and shared between callers: treat them as read-only.
+Relationships are not loaded; use a regular session query when related rows are needed.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession, object_session, undefer
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import Badge, HistoricalPeriod
+
+_DIRTY_KEY = "reference_data_dirty"
+_MAX_ENTRIES = 256
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+# Bumped on every clear. A reader records it before querying and only stores its result if it is
+# unchanged, so a row read before a concurrent commit cannot be cached after that commit's clear.
+_generation = 0
+_periods: Dict[int, Optional[HistoricalPeriod]] = {}
+_badges: Dict[int, Optional[Badge]] = {}
+_active_badges: Dict[str, Tuple[Badge, ...]] = {}
+
+
+def _read_through(cache: Dict[Any, T], key: Any, load: Callable[[], T]) -> T:
+    with _lock:
+        if key in cache:
+            return cache[key]
+        generation = _generation
+    value = load()
+    with _lock:
+        if generation == _generation:
+            if len(cache) >= _MAX_ENTRIES:
+                cache.pop(next(iter(cache)))
+            cache[key] = value
+    return value
+
+
+def _load_historical_period(period_id: int) -> Optional[HistoricalPeriod]:
+    with get_session() as session:
+        return session.get(HistoricalPeriod, period_id)
+
+
+def _load_badge(badge_id: int) -> Optional[Badge]:
+    with get_session() as session:
+        return session.get(Badge, badge_id, options=[undefer(Badge.criteria)])  # type: ignore[arg-type]
+
+
+def _load_active_badges() -> Tuple[Badge, ...]:
+    with get_session() as session:
+        statement = (
+            select(Badge)
+            .where(Badge.is_active == True)  # noqa: E712
+            .order_by(Badge.name)
+            .options(undefer(Badge.criteria))  # type: ignore[arg-type]
+        )
+        return tuple(session.exec(statement).all())
+
+
+def get_historical_period(period_id: int) -> Optional[HistoricalPeriod]:
+    return _read_through(_periods, period_id, lambda: _load_historical_period(period_id))
+
+
+def get_badge(badge_id: int) -> Optional[Badge]:
+    return _read_through(_badges, badge_id, lambda: _load_badge(badge_id))
+
+
+def list_active_badges() -> List[Badge]:
+    return list(_read_through(_active_badges, "active", _load_active_badges))
+
+
+def clear_reference_cache() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        _periods.clear()
+        _badges.clear()
+        _active_badges.clear()
+
+
+# Writes only mark the session; caches are dropped once the transaction commits, so readers in
+# between still see the committed row. Readers racing the commit are handled by _generation.
+def _mark_dirty(mapper: Any, connection: Any, target: Any) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[_DIRTY_KEY] = True
+
+
+for _model in (HistoricalPeriod, Badge):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _mark_dirty)
+
+
+@event.listens_for(SASession, "after_commit")
+def _clear_after_commit(session: SASession) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        clear_reference_cache()
+
+
+@event.listens_for(SASession, "after_rollback")
+def _forget_after_rollback(session: SASession) -> None:
+    session.info.pop(_DIRTY_KEY, None)
@@ -0,0 +1,21 @@
+from typing import List, Tuple
+
+from sqlalchemy.orm import raiseload
+from sqlmodel import col, desc, select
+
+from app.loaders import RequestLoaders
+from app.models import TermConnection, VocabularyTerm
+
+
+async def get_term_connections(loaders: RequestLoaders, term_id: int) -> List[Tuple[TermConnection, VocabularyTerm]]:
+    """Outgoing connections of a term paired with their target terms, strongest first."""
+    statement = (
+        select(TermConnection)
+        .where(TermConnection.source_term_id == term_id)
+        .order_by(desc(TermConnection.strength), col(TermConnection.id))
+        .options(raiseload("*"))
+    )
+    async with loaders.session_lock:
+        connections = (await loaders.session.exec(statement)).all()
+    targets = await loaders.vocabulary_terms.load_many(connection.target_term_id for connection in connections)
+    return [(connection, target) for connection, target in zip(connections, targets) if target is not None]
@@ -1,5 +1,6 @@
 import logging
 import os
+from app.database import dispose_engines
 from app.startup import startup
 from nicegui import app, ui
 from fastapi import FastAPI
@@ -30,6 +31,7 @@ async def health():
 logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
 
 app.on_startup(startup)
+app.on_shutdown(dispose_engines)
 
 # Add security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
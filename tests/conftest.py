@@ -1,5 +1,8 @@
-from typing import Generator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Generator, Iterator, List
 import pytest
+from sqlalchemy import Engine, event
+from app.database import ASYNC_ENGINE, ENGINE, reset_db
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +13,40 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture()
+def clean_db() -> Generator[None, None, None]:
+    reset_db()
+    yield
+    reset_db()
+
+
+@contextmanager
+def _record_statements(engine: Engine) -> Iterator[List[str]]:
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture()
+def statements() -> Generator[List[str], None, None]:
+    """SQL sent through the sync ENGINE while the test runs; clear() it after setting up data."""
+    with _record_statements(ENGINE) as executed:
+        yield executed
+
+
+@pytest.fixture()
+async def async_statements() -> AsyncGenerator[List[str], None]:
+    """SQL sent through ASYNC_ENGINE while the test runs."""
+    with _record_statements(ASYNC_ENGINE.sync_engine) as executed:
+        yield executed
+    # asyncpg connections are bound to the event loop that opened them
+    await ASYNC_ENGINE.dispose()
@@ -0,0 +1,145 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import func, select
+
+from app.database import get_session
+from app.hero_diary_service import fetch_historical_figure_full, get_historical_figure_detail
+from app.models import (
+    DiaryEntry,
+    FigureMultimedia,
+    FigureQuote,
+    HistoricalFigure,
+    MediaType,
+    StudentGrade,
+    TimelineEvent,
+)
+
+
+@pytest.fixture()
+def figure_id(clean_db) -> int:
+    with get_session() as session:
+        figure = HistoricalFigure(
+            name="Kartini",
+            biography_summary="Pelopor emansipasi perempuan Indonesia.",
+            reading_level=StudentGrade.GRADE_6,
+            historical_period_id=None,
+            birth_place=None,
+            occupation=None,
+            portrait_url=None,
+        )
+        session.add(figure)
+        session.commit()
+        session.refresh(figure)
+        assert figure.id is not None
+
+        session.add_all(
+            [
+                DiaryEntry(
+                    historical_figure_id=figure.id,
+                    title="Surat kedua",
+                    entry_text="...",
+                    historical_context="Jepara, 1900",
+                    display_order=2,
+                    emotional_tone=None,
+                ),
+                DiaryEntry(
+                    historical_figure_id=figure.id,
+                    title="Surat pertama",
+                    entry_text="...",
+                    historical_context="Jepara, 1899",
+                    display_order=1,
+                    emotional_tone=None,
+                ),
+                TimelineEvent(
+                    historical_figure_id=figure.id,
+                    title="Lahir di Jepara",
+                    description="",
+                    event_year=1879,
+                    location=None,
+                ),
+                FigureQuote(historical_figure_id=figure.id, text="Habis gelap terbitlah terang"),
+                FigureMultimedia(
+                    historical_figure_id=figure.id,
+                    media_type=MediaType.IMAGE,
+                    media_url="/media/kartini.jpg",
+                    title="Potret Kartini",
+                    description=None,
+                    source_attribution=None,
+                    is_primary=True,
+                ),
+            ]
+        )
+        session.commit()
+        return figure.id
+
+
+def test_get_historical_figure_detail(figure_id):
+    with get_session() as session:
+        figure = get_historical_figure_detail(session, figure_id)
+
+    # everything the page renders must already be loaded once the session is gone
+    assert figure is not None
+    assert figure.biography_summary == "Pelopor emansipasi perempuan Indonesia."
+    assert [entry.title for entry in figure.diary_entries] == ["Surat pertama", "Surat kedua"]
+    assert [entry.historical_context for entry in figure.diary_entries] == ["Jepara, 1899", "Jepara, 1900"]
+    assert [entry.entry_text for entry in figure.diary_entries] == ["...", "..."]
+    assert [event.event_year for event in figure.timeline_events] == [1879]
+    assert [quote.text for quote in figure.famous_quotes] == ["Habis gelap terbitlah terang"]
+    assert [media.title for media in figure.multimedia_content] == ["Potret Kartini"]
+    with pytest.raises(InvalidRequestError):
+        _ = figure.ar_models
+
+
+def test_default_ordinals_keep_insertion_order(figure_id):
+    with get_session() as session:
+        for text in ("Tubuh boleh terpenjara", "Jiwa harus bebas", "Cita-cita adalah api"):
+            session.add(FigureQuote(historical_figure_id=figure_id, text=text))
+            session.commit()
+
+    expected = ["Habis gelap terbitlah terang", "Tubuh boleh terpenjara", "Jiwa harus bebas", "Cita-cita adalah api"]
+    with get_session() as session:
+        figure = get_historical_figure_detail(session, figure_id)
+        full = fetch_historical_figure_full(session, figure_id)
+
+    assert figure is not None
+    assert [quote.text for quote in figure.famous_quotes] == expected
+    assert full is not None
+    assert full.famous_quotes == expected
+
+
+def test_get_historical_figure_detail_missing(clean_db):
+    with get_session() as session:
+        assert get_historical_figure_detail(session, 9999) is None
+
+
+def test_fetch_historical_figure_full_single_query(figure_id, statements):
+    statements.clear()
+    with get_session() as session:
+        figure = fetch_historical_figure_full(session, figure_id)
+
+    assert len(statements) == 1
+    assert figure is not None
+    assert figure.biography_summary == "Pelopor emansipasi perempuan Indonesia."
+    assert figure.reading_level == StudentGrade.GRADE_6
+    assert figure.major_contributions == []
+    assert figure.famous_quotes == ["Habis gelap terbitlah terang"]
+    assert [entry.title for entry in figure.diary_entries] == ["Surat pertama", "Surat kedua"]
+    assert [event.event_year for event in figure.timeline_events] == [1879]
+    assert figure.multimedia_content[0].media_type == MediaType.IMAGE
+
+
+def test_fetch_historical_figure_full_missing(clean_db):
+    with get_session() as session:
+        assert fetch_historical_figure_full(session, 9999) is None
+
+
+def test_deleting_figure_cascades_to_children(figure_id):
+    with get_session() as session:
+        figure = session.get(HistoricalFigure, figure_id)
+        assert figure is not None
+        session.delete(figure)
+        session.commit()
+
+    with get_session() as session:
+        for model in (DiaryEntry, TimelineEvent, FigureQuote, FigureMultimedia):
+            assert session.exec(select(func.count()).select_from(model)).one() == 0
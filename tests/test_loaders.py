@@ -0,0 +1,199 @@
+import asyncio
+from typing import List
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.database import get_async_session, get_session
+from app.loaders import RequestLoaders
+from app.models import (
+    DiaryEntry,
+    HistoricalFigure,
+    HistoricalPeriod,
+    QuestionDifficulty,
+    QuizLevel,
+    QuizQuestion,
+    QuestionType,
+    StudentGrade,
+    TermConnection,
+    TermRelationshipType,
+    VocabularyTerm,
+)
+from app.vocabulary_service import get_term_connections
+
+
+@pytest.fixture()
+def term_ids(clean_db) -> List[int]:
+    with get_session() as session:
+        terms = [
+            VocabularyTerm(
+                term=term,
+                definition=f"Definisi {term}",
+                pronunciation=None,
+                audio_url=None,
+                etymology=None,
+                usage_example=None,
+                difficulty_level=QuestionDifficulty.EASY,
+                grade_level=StudentGrade.GRADE_4,
+                historical_period_id=None,
+            )
+            for term in ["prasasti", "candi", "kerajaan"]
+        ]
+        session.add_all(terms)
+        session.commit()
+        ids = [term.id for term in terms if term.id is not None]
+
+        session.add_all(
+            [
+                TermConnection(
+                    source_term_id=ids[0],
+                    target_term_id=ids[1],
+                    relationship_type=TermRelationshipType.RELATED_TO,
+                    description=None,
+                    strength=2,
+                ),
+                TermConnection(
+                    source_term_id=ids[0],
+                    target_term_id=ids[2],
+                    relationship_type=TermRelationshipType.PART_OF,
+                    description=None,
+                    strength=4,
+                ),
+            ]
+        )
+        session.commit()
+        return ids
+
+
+def selects(statements: List[str]) -> List[str]:
+    return [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+
+
+async def test_loader_batches_same_tick_loads(term_ids, async_statements):
+    async with get_async_session() as session:
+        async with RequestLoaders(session) as loaders:
+            terms = await asyncio.gather(
+                loaders.vocabulary_terms.load(term_ids[2]),
+                loaders.vocabulary_terms.load(term_ids[0]),
+                loaders.vocabulary_terms.load(term_ids[0]),
+                loaders.vocabulary_terms.load(9999),
+            )
+
+            assert [term.term if term is not None else None for term in terms] == [
+                "kerajaan",
+                "prasasti",
+                "prasasti",
+                None,
+            ]
+            assert len(selects(async_statements)) == 1
+
+            cached = await loaders.vocabulary_terms.load(term_ids[2])
+            assert cached is terms[0]
+            assert len(selects(async_statements)) == 1
+            # deferred columns come with the batch; lazy-loading them would fail on an AsyncSession
+            assert cached is not None
+            assert cached.definition == "Definisi kerajaan"
+
+
+async def test_cancelled_caller_does_not_cancel_shared_load(term_ids, async_statements):
+    async with get_async_session() as session:
+        async with RequestLoaders(session) as loaders:
+            waiting = loaders.vocabulary_terms.load(term_ids[0])
+            cancelled = asyncio.create_task(loaders.vocabulary_terms.load_many([term_ids[0], term_ids[1]]))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+
+            term = await asyncio.wait_for(waiting, timeout=5)
+            assert term is not None
+            assert term.term == "prasasti"
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            assert len(selects(async_statements)) == 1
+
+
+async def test_drain_waits_for_in_flight_batches(term_ids, async_statements):
+    async with get_async_session() as session:
+        async with RequestLoaders(session) as loaders:
+            # requested but never awaited: leaving the block must still let the batch finish
+            loaders.vocabulary_terms.load(term_ids[0])
+        assert len(selects(async_statements)) == 1
+
+
+@pytest.fixture()
+def figure_and_level_ids(clean_db):
+    with get_session() as session:
+        period = HistoricalPeriod(name="Kerajaan Mataram", description="Abad ke-16 sampai 18", background_image=None)
+        figure = HistoricalFigure(
+            name="Sultan Agung",
+            biography_summary="Raja Mataram",
+            reading_level=StudentGrade.GRADE_5,
+            historical_period_id=None,
+            birth_place=None,
+            occupation=None,
+            portrait_url=None,
+        )
+        session.add_all([period, figure])
+        session.commit()
+
+        level = QuizLevel(
+            historical_period_id=period.id,  # type: ignore[arg-type]
+            level_number=1,
+            title="Mataram",
+            description="Kerajaan Mataram Islam",
+            completion_points_reward=50,
+        )
+        session.add_all(
+            [
+                level,
+                DiaryEntry(
+                    historical_figure_id=figure.id,  # type: ignore[arg-type]
+                    title="Penyerangan Batavia",
+                    entry_text="...",
+                    historical_context="1628",
+                ),
+            ]
+        )
+        session.commit()
+        session.add(
+            QuizQuestion(
+                quiz_level_id=level.id,  # type: ignore[arg-type]
+                question_text="Sultan Agung menyerang Batavia.",
+                question_type=QuestionType.TRUE_FALSE,
+                difficulty=QuestionDifficulty.EASY,
+                explanation="Pada tahun 1628 dan 1629.",
+                correct_answer="true",
+            )
+        )
+        session.commit()
+        return {"figure_id": figure.id, "level_id": level.id}
+
+
+async def test_figure_and_level_loaders_skip_relationships(figure_and_level_ids, async_statements):
+    async with get_async_session() as session:
+        async with RequestLoaders(session) as loaders:
+            figure, level = await asyncio.gather(
+                loaders.historical_figures.load(figure_and_level_ids["figure_id"]),
+                loaders.quiz_levels.load(figure_and_level_ids["level_id"]),
+            )
+
+        assert figure is not None
+        assert figure.name == "Sultan Agung"
+        assert figure.biography_summary == "Raja Mataram"
+        assert level is not None
+        assert level.title == "Mataram"
+        # one SELECT per loader batch, without the mapper-level selectin loads
+        assert len(selects(async_statements)) == 2
+        with pytest.raises(InvalidRequestError):
+            _ = figure.diary_entries
+        with pytest.raises(InvalidRequestError):
+            _ = level.questions
+
+
+async def test_get_term_connections(term_ids, async_statements):
+    async with get_async_session() as session:
+        async with RequestLoaders(session) as loaders:
+            connections = await get_term_connections(loaders, term_ids[0])
+
+        assert [(connection.strength, term.term) for connection, term in connections] == [(4, "kerajaan"), (2, "candi")]
+        # one query for the connections, one batched query for all target terms
+        assert len(selects(async_statements)) == 2
@@ -0,0 +1,175 @@
+from decimal import Decimal
+
+import pytest
+from sqlmodel import Session, SQLModel, delete, func, select
+
+from app.database import get_session
+from app.models import (
+    ARModel,
+    DiaryEntry,
+    DiaryEntrySource,
+    FavoriteDiaryEntry,
+    HeroDiaryProgress,
+    HistoricalFigure,
+    LearningObjective,
+    LessonPlan,
+    StudentGrade,
+    User,
+)
+
+
+def make_ar_model(**fields) -> ARModel:
+    return ARModel(
+        historical_figure_id=None,
+        model_name="Candi Borobudur",
+        model_file_path="/models/borobudur.glb",
+        texture_file_path=None,
+        animation_file_path=None,
+        **fields,
+    )
+
+
+def test_completion_percentage_from_basis_points():
+    progress = HeroDiaryProgress(student_id=1, historical_figure_id=1, completion_basis_points=1234, notes=None)
+
+    assert progress.completion_percentage == Decimal("12.34")
+    assert HeroDiaryProgress(student_id=1, historical_figure_id=1, notes=None).completion_percentage == 0
+
+
+def test_ar_model_scale_factor_and_file_size():
+    model = make_ar_model(scale_factor_millis=1500, file_size_kb=2560)
+
+    assert model.scale_factor == Decimal("1.5")
+    assert model.file_size_mb == Decimal("2.50")
+    assert make_ar_model(file_size_kb=1000).file_size_mb == Decimal("0.98")
+    assert make_ar_model(file_size_kb=None).file_size_mb is None
+
+
+def test_old_decimal_names_are_not_constructor_fields():
+    model = make_ar_model(file_size_kb=None, scale_factor=2)
+
+    assert model.scale_factor_millis == 1000
+    assert model.scale_factor == Decimal("1.000")
+
+
+@pytest.fixture()
+def teacher_and_figure(clean_db):
+    with get_session() as session:
+        teacher = User(username="guru1", email="guru1@example.com", full_name="Guru Satu", is_teacher=True)
+        student = User(
+            username="siswa1", email="siswa1@example.com", full_name="Siswa Satu", grade=StudentGrade.GRADE_5
+        )
+        figure = HistoricalFigure(
+            name="Cut Nyak Dhien",
+            biography_summary="Pahlawan dari Aceh.",
+            reading_level=StudentGrade.GRADE_5,
+            historical_period_id=None,
+            birth_place=None,
+            occupation=None,
+            portrait_url=None,
+        )
+        session.add_all([teacher, student, figure])
+        session.commit()
+        return {"teacher_id": teacher.id, "student_id": student.id, "figure_id": figure.id}
+
+
+def make_diary_entry(figure_id: int, title: str, display_order: int) -> DiaryEntry:
+    return DiaryEntry(
+        historical_figure_id=figure_id,
+        title=title,
+        entry_text="...",
+        historical_context="Aceh, 1873",
+        display_order=display_order,
+        emotional_tone=None,
+    )
+
+
+def count_rows(session: Session, model: type[SQLModel]) -> int:
+    return session.exec(select(func.count()).select_from(model)).one()
+
+
+def test_learning_objectives_round_trip_and_cascade(teacher_and_figure):
+    with get_session() as session:
+        plan = LessonPlan(
+            title="Perang Aceh",
+            description="Perlawanan rakyat Aceh",
+            grade_level=StudentGrade.GRADE_5,
+            subject="Sejarah",
+            duration_minutes=45,
+            created_by_id=teacher_and_figure["teacher_id"],
+        )
+        session.add(plan)
+        session.commit()
+        plan_id = plan.id
+        assert plan_id is not None
+        session.add_all(
+            [
+                LearningObjective(lesson_plan_id=plan_id, ordinal=1, text="Menjelaskan sebab perang"),
+                LearningObjective(lesson_plan_id=plan_id, ordinal=0, text="Mengenal tokoh Aceh"),
+            ]
+        )
+        session.commit()
+
+    with get_session() as session:
+        plan = session.get(LessonPlan, plan_id)
+        assert plan is not None
+        assert [objective.text for objective in plan.learning_objectives] == [
+            "Mengenal tokoh Aceh",
+            "Menjelaskan sebab perang",
+        ]
+
+        session.execute(delete(LessonPlan))
+        session.commit()
+        assert count_rows(session, LearningObjective) == 0
+
+
+def test_diary_entry_sources_round_trip_and_cascade(teacher_and_figure):
+    with get_session() as session:
+        entry = make_diary_entry(teacher_and_figure["figure_id"], "Kehilangan", 1)
+        session.add(entry)
+        session.commit()
+        entry_id = entry.id
+        assert entry_id is not None
+        session.add_all(
+            [
+                DiaryEntrySource(diary_entry_id=entry_id, ordinal=1, text="Hikayat Perang Sabil"),
+                DiaryEntrySource(diary_entry_id=entry_id, ordinal=0, text="Arsip kolonial"),
+            ]
+        )
+        session.commit()
+
+    with get_session() as session:
+        entry = session.get(DiaryEntry, entry_id)
+        assert entry is not None
+        assert [source.text for source in entry.sources] == ["Arsip kolonial", "Hikayat Perang Sabil"]
+
+        session.execute(delete(DiaryEntry))
+        session.commit()
+        assert count_rows(session, DiaryEntrySource) == 0
+
+
+def test_favorite_diary_entries_round_trip_and_cascade(teacher_and_figure):
+    with get_session() as session:
+        later = make_diary_entry(teacher_and_figure["figure_id"], "Bergerilya", 2)
+        first = make_diary_entry(teacher_and_figure["figure_id"], "Kehilangan", 1)
+        unused = make_diary_entry(teacher_and_figure["figure_id"], "Pengasingan", 3)
+        progress = HeroDiaryProgress(
+            student_id=teacher_and_figure["student_id"],
+            historical_figure_id=teacher_and_figure["figure_id"],
+            notes=None,
+            favorite_entries=[later, first],
+        )
+        session.add_all([progress, unused])
+        session.commit()
+        progress_id = progress.id
+
+    with get_session() as session:
+        progress = session.get(HeroDiaryProgress, progress_id)
+        assert progress is not None
+        assert [entry.title for entry in progress.favorite_entries] == ["Kehilangan", "Bergerilya"]
+
+        # ON DELETE CASCADE in the database, not an ORM-side delete of the link rows
+        session.execute(delete(HeroDiaryProgress))
+        session.commit()
+        assert count_rows(session, FavoriteDiaryEntry) == 0
+        assert count_rows(session, DiaryEntry) == 3
@@ -0,0 +1,369 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlmodel import select, text
+
+from app.database import get_session
+from app.models import (
+    AnswerOption,
+    HistoricalPeriod,
+    QuestionDifficulty,
+    QuestionType,
+    QuizAttempt,
+    QuizLevel,
+    QuizQuestion,
+    StudentAnswer,
+    StudentAnswerCreate,
+    StudentGrade,
+    User,
+)
+from app.quiz_service import (
+    get_quiz_attempt_with_answers,
+    get_quiz_level_with_questions,
+    list_unlocked_levels,
+    parse_student_answers,
+    start_quiz_attempt,
+    submit_quiz_answers,
+)
+
+
+@pytest.fixture()
+def quiz_data(clean_db):
+    with get_session() as session:
+        period = HistoricalPeriod(name="Kerajaan Majapahit", description="Abad ke-13 sampai 16", background_image=None)
+        session.add(period)
+        session.commit()
+        session.refresh(period)
+
+        level = QuizLevel(
+            historical_period_id=period.id,  # type: ignore[arg-type]
+            level_number=1,
+            title="Awal Majapahit",
+            description="Pendirian kerajaan",
+            completion_points_reward=50,
+        )
+        session.add(level)
+        session.commit()
+        session.refresh(level)
+
+        second = QuizQuestion(
+            quiz_level_id=level.id,  # type: ignore[arg-type]
+            question_text="Siapa patih yang mengucapkan Sumpah Palapa?",
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            difficulty=QuestionDifficulty.EASY,
+            explanation="Gajah Mada mengucapkan Sumpah Palapa.",
+            correct_answer="Gajah Mada",
+            display_order=2,
+        )
+        first = QuizQuestion(
+            quiz_level_id=level.id,  # type: ignore[arg-type]
+            question_text="Majapahit didirikan oleh Raden Wijaya.",
+            question_type=QuestionType.TRUE_FALSE,
+            difficulty=QuestionDifficulty.EASY,
+            explanation="Raden Wijaya mendirikan Majapahit pada 1293.",
+            correct_answer="true",
+            display_order=1,
+        )
+        session.add_all([second, first])
+        session.commit()
+        session.refresh(second)
+        session.refresh(first)
+
+        session.add_all(
+            [
+                AnswerOption(question_id=second.id, ordinal=1, text="Hayam Wuruk"),  # type: ignore[arg-type]
+                AnswerOption(question_id=second.id, ordinal=0, text="Gajah Mada"),  # type: ignore[arg-type]
+            ]
+        )
+
+        student = User(
+            username="siswa1",
+            email="siswa1@example.com",
+            full_name="Siswa Satu",
+            grade=StudentGrade.GRADE_5,
+            school_name="SD Nusantara",
+        )
+        session.add(student)
+        session.commit()
+        session.refresh(student)
+
+        attempt = QuizAttempt(student_id=student.id, quiz_level_id=level.id, attempt_number=1)  # type: ignore[arg-type]
+        session.add(attempt)
+        session.commit()
+        session.refresh(attempt)
+
+        session.add(
+            StudentAnswer(
+                quiz_attempt_id=attempt.id,  # type: ignore[arg-type]
+                question_id=second.id,  # type: ignore[arg-type]
+                student_answer="Gajah Mada",
+                is_correct=True,
+                points_earned=10,
+            )
+        )
+        session.commit()
+
+        open_attempt = QuizAttempt(student_id=student.id, quiz_level_id=level.id, attempt_number=2)  # type: ignore[arg-type]
+        session.add(open_attempt)
+        session.commit()
+        session.refresh(open_attempt)
+
+        return {
+            "level_id": level.id,
+            "attempt_id": attempt.id,
+            "open_attempt_id": open_attempt.id,
+            "student_id": student.id,
+            "first_question_id": first.id,
+            "second_question_id": second.id,
+        }
+
+
+def test_get_quiz_level_with_questions_orders_questions_and_options(quiz_data):
+    with get_session() as session:
+        level = get_quiz_level_with_questions(session, quiz_data["level_id"])
+
+        assert level is not None
+        assert [question.display_order for question in level.questions] == [1, 2]
+        assert level.questions[0].answer_options == []
+        assert [option.text for option in level.questions[1].answer_options] == ["Gajah Mada", "Hayam Wuruk"]
+
+
+def test_get_quiz_level_with_questions_raises_on_unplanned_relationship(quiz_data):
+    with get_session() as session:
+        level = get_quiz_level_with_questions(session, quiz_data["level_id"])
+
+        assert level is not None
+        with pytest.raises(InvalidRequestError):
+            _ = level.historical_period
+
+
+def test_get_quiz_level_with_questions_missing(clean_db):
+    with get_session() as session:
+        assert get_quiz_level_with_questions(session, 9999) is None
+
+
+def test_list_unlocked_levels(clean_db):
+    with get_session() as session:
+        periods = [
+            HistoricalPeriod(name="Kerajaan Kediri", description="Abad ke-11", background_image=None),
+            HistoricalPeriod(name="Kerajaan Singhasari", description="Abad ke-13", background_image=None),
+        ]
+        session.add_all(periods)
+        session.commit()
+        for period in periods:
+            for level_number, unlock_points in ((1, 0), (2, 100), (3, 250)):
+                session.add(
+                    QuizLevel(
+                        historical_period_id=period.id,  # type: ignore[arg-type]
+                        level_number=level_number,
+                        title=f"{period.name} {level_number}",
+                        description="Tingkat kuis",
+                        unlock_points_required=unlock_points,
+                        completion_points_reward=50,
+                    )
+                )
+        session.commit()
+        kediri_id = periods[0].id
+
+    with get_session() as session:
+        assert [level.title for level in list_unlocked_levels(session, 100, kediri_id)] == [
+            "Kerajaan Kediri 1",
+            "Kerajaan Kediri 2",
+        ]
+        unlocked = list_unlocked_levels(session, 0)
+        assert [level.level_number for level in unlocked] == [1, 1]
+        with pytest.raises(InvalidRequestError):
+            unlocked[0].questions
+
+
+def test_get_quiz_attempt_with_answers(quiz_data):
+    with get_session() as session:
+        attempt = get_quiz_attempt_with_answers(session, quiz_data["attempt_id"])
+
+    assert attempt is not None
+    assert attempt.started_at is not None
+    assert attempt.started_at.tzinfo is not None
+    assert len(attempt.student_answers) == 1
+    question = attempt.student_answers[0].question
+    assert question.id == quiz_data["second_question_id"]
+    assert question.explanation == "Gajah Mada mengucapkan Sumpah Palapa."
+    with pytest.raises(InvalidRequestError):
+        _ = attempt.student
+
+
+def test_submit_quiz_answers_batches_inserts_and_credits_points(quiz_data, statements):
+    answers = [
+        StudentAnswerCreate(question_id=quiz_data["first_question_id"], student_answer=" TRUE "),
+        StudentAnswerCreate(question_id=quiz_data["second_question_id"], student_answer="Hayam Wuruk"),
+    ]
+    statements.clear()
+    with get_session() as session:
+        attempt = submit_quiz_answers(session, quiz_data["open_attempt_id"], answers)
+
+    # lock + questions + one batched INSERT + UPDATE + column-only refresh; answers are never re-read
+    assert len(statements) == 5
+    assert len([statement for statement in statements if statement.startswith("INSERT INTO student_answers")]) == 1
+    assert not any("FROM student_answers" in statement for statement in statements)
+    assert attempt.is_completed
+    assert attempt.score == 50
+    assert not attempt.is_passed
+    assert attempt.total_points_earned == 10
+    assert attempt.completed_at is not None
+
+    with get_session() as session:
+        stored = session.exec(
+            select(StudentAnswer).where(StudentAnswer.quiz_attempt_id == quiz_data["open_attempt_id"])
+        ).all()
+        assert sorted((answer.question_id, answer.is_correct) for answer in stored) == sorted(
+            [(quiz_data["first_question_id"], True), (quiz_data["second_question_id"], False)]
+        )
+        assert all(answer.answered_at is not None for answer in stored)
+
+        student = session.get(User, quiz_data["student_id"])
+        assert student is not None
+        assert student.total_points == 10
+        assert student.streak_days == 1
+        assert student.last_activity == attempt.completed_at
+
+
+def test_student_points_follow_attempt_rows(quiz_data):
+    with get_session() as session:
+        submit_quiz_answers(
+            session,
+            quiz_data["open_attempt_id"],
+            [StudentAnswerCreate(question_id=quiz_data["first_question_id"], student_answer="true")],
+        )
+        attempt = session.get(QuizAttempt, quiz_data["open_attempt_id"])
+        assert attempt is not None
+        attempt.total_points_earned = 25
+        session.commit()
+
+        student = session.get(User, quiz_data["student_id"])
+        assert student is not None
+        assert student.total_points == 25
+
+        session.delete(attempt)
+        session.commit()
+        session.refresh(student)
+        assert student.total_points == 0
+
+
+def test_submit_quiz_answers_rejects_foreign_question(quiz_data):
+    with get_session() as session:
+        with pytest.raises(ValueError):
+            submit_quiz_answers(
+                session, quiz_data["open_attempt_id"], [StudentAnswerCreate(question_id=9999, student_answer="x")]
+            )
+        # the attempt's row lock is released with the transaction
+        assert not session.in_transaction()
+
+
+def test_submit_quiz_answers_rejects_duplicate_answers(quiz_data):
+    answer = StudentAnswerCreate(question_id=quiz_data["first_question_id"], student_answer="true")
+    with get_session() as session:
+        with pytest.raises(ValueError):
+            submit_quiz_answers(session, quiz_data["open_attempt_id"], [answer, answer])
+        assert not session.in_transaction()
+
+        stored = session.exec(
+            select(StudentAnswer).where(StudentAnswer.quiz_attempt_id == quiz_data["open_attempt_id"])
+        ).all()
+        attempt = session.get(QuizAttempt, quiz_data["open_attempt_id"])
+        assert stored == []
+        assert attempt is not None
+        assert not attempt.is_completed
+
+
+def test_submit_quiz_answers_rejects_completed_attempt(quiz_data):
+    with get_session() as session:
+        submit_quiz_answers(session, quiz_data["open_attempt_id"], [])
+
+        with pytest.raises(ValueError):
+            submit_quiz_answers(session, quiz_data["open_attempt_id"], [])
+        assert not session.in_transaction()
+
+
+def test_submit_quiz_answers_missing_attempt(clean_db):
+    with get_session() as session:
+        with pytest.raises(ValueError):
+            submit_quiz_answers(session, 9999, [])
+
+
+@pytest.fixture()
+def level_and_student(clean_db):
+    with get_session() as session:
+        period = HistoricalPeriod(name="Kerajaan Sriwijaya", description="Abad ke-7 sampai 13", background_image=None)
+        session.add(period)
+        session.commit()
+        session.refresh(period)
+
+        level = QuizLevel(
+            historical_period_id=period.id,  # type: ignore[arg-type]
+            level_number=1,
+            title="Sriwijaya",
+            description="Kerajaan maritim",
+            completion_points_reward=50,
+            max_attempts=2,
+        )
+        student = User(username="siswa2", email="siswa2@example.com", full_name="Siswa Dua", grade=StudentGrade.GRADE_4)
+        session.add_all([level, student])
+        session.commit()
+        return {"level_id": level.id, "student_id": student.id}
+
+
+def test_start_quiz_attempt_resumes_unfinished_attempt(level_and_student, statements):
+    statements.clear()
+    with get_session() as session:
+        first = start_quiz_attempt(session, level_and_student["student_id"], level_and_student["level_id"])
+        # in-progress lookup, level limit, MAX(attempt_number), INSERT, column-only refresh
+        assert len(statements) == 5
+        assert not any("FROM quiz_questions" in statement for statement in statements)
+        again = start_quiz_attempt(session, level_and_student["student_id"], level_and_student["level_id"])
+
+        assert first.attempt_number == 1
+        assert again.id == first.id
+
+
+def test_start_quiz_attempt_leaves_student_row_untouched(level_and_student):
+    # xmin changes whenever the row is rewritten, including by the points trigger
+    row_version = text("SELECT xmin::text FROM users WHERE id = :student_id")
+    params = {"student_id": level_and_student["student_id"]}
+    with get_session() as session:
+        before = session.exec(row_version, params=params).scalar_one()  # type: ignore[call-overload]
+        start_quiz_attempt(session, level_and_student["student_id"], level_and_student["level_id"])
+        after = session.exec(row_version, params=params).scalar_one()  # type: ignore[call-overload]
+
+    assert after == before
+
+
+def test_start_quiz_attempt_numbers_attempts_and_enforces_limit(level_and_student):
+    with get_session() as session:
+        for expected_number in (1, 2):
+            attempt = start_quiz_attempt(session, level_and_student["student_id"], level_and_student["level_id"])
+            assert attempt.attempt_number == expected_number
+            submit_quiz_answers(session, attempt.id, [])  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError):
+            start_quiz_attempt(session, level_and_student["student_id"], level_and_student["level_id"])
+
+
+def test_duplicate_attempt_number_rejected(level_and_student):
+    with get_session() as session:
+        for _ in range(2):
+            session.add(
+                QuizAttempt(
+                    student_id=level_and_student["student_id"],
+                    quiz_level_id=level_and_student["level_id"],
+                    attempt_number=1,
+                )
+            )
+        with pytest.raises(IntegrityError):
+            session.commit()
+
+
+def test_parse_student_answers():
+    answers = parse_student_answers(b'[{"question_id": 3, "student_answer": "Gajah Mada"}]')
+
+    assert answers == [StudentAnswerCreate(question_id=3, student_answer="Gajah Mada")]
+    with pytest.raises(ValidationError):
+        parse_student_answers('[{"question_id": 3, "student_answer": "%s"}]' % ("x" * 1001))
@@ -0,0 +1,123 @@
+from typing import List
+
+import pytest
+from sqlalchemy import event
+
+from app.database import ENGINE, get_session
+from app.models import Badge, BadgeType, HistoricalPeriod
+from app.reference_data import clear_reference_cache, get_badge, get_historical_period, list_active_badges
+
+
+@pytest.fixture()
+def reference_cache(clean_db):
+    clear_reference_cache()
+    yield
+    clear_reference_cache()
+
+
+def make_badge(name: str, is_active: bool = True) -> Badge:
+    return Badge(
+        name=name,
+        description=f"Lencana {name}",
+        badge_type=BadgeType.EXPLORER,
+        icon_url=f"/icons/{name}.png",
+        criteria={"levels_completed": 3},
+        is_active=is_active,
+    )
+
+
+def test_get_historical_period_is_cached(reference_cache, statements):
+    with get_session() as session:
+        period = HistoricalPeriod(name="Kerajaan Kutai", description="Kerajaan Hindu tertua", background_image=None)
+        session.add(period)
+        session.commit()
+        session.refresh(period)
+        period_id = period.id
+    assert period_id is not None
+    statements.clear()
+
+    first = get_historical_period(period_id)
+    second = get_historical_period(period_id)
+
+    assert first is not None
+    assert first.name == "Kerajaan Kutai"
+    assert second is first
+    assert len(statements) == 1
+
+
+def test_badge_cache_invalidated_on_commit(reference_cache):
+    with get_session() as session:
+        badge = make_badge("penjelajah")
+        session.add_all([badge, make_badge("arsip", is_active=False)])
+        session.commit()
+        session.refresh(badge)
+        badge_id = badge.id
+    assert badge_id is not None
+
+    cached = get_badge(badge_id)
+    assert cached is not None
+    assert cached.criteria == {"levels_completed": 3}
+    assert [badge.name for badge in list_active_badges()] == ["penjelajah"]
+
+    with get_session() as session:
+        badge = session.get(Badge, badge_id)
+        assert badge is not None
+        badge.points_reward = 25
+        session.add(make_badge("cendekia"))
+        session.commit()
+
+    refreshed = get_badge(badge_id)
+    assert refreshed is not None
+    assert refreshed.points_reward == 25
+    assert [badge.name for badge in list_active_badges()] == ["cendekia", "penjelajah"]
+
+
+def test_read_racing_a_commit_is_not_cached(reference_cache):
+    with get_session() as session:
+        period = HistoricalPeriod(name="Kerajaan Tarumanegara", description="Abad ke-5", background_image=None)
+        session.add(period)
+        session.commit()
+        session.refresh(period)
+        period_id = period.id
+    assert period_id is not None
+
+    renamed: List[bool] = []
+
+    def rename_after_read(conn, cursor, statement, parameters, context, executemany):
+        # the reader has fetched the old row; a writer commits before the reader stores it
+        if renamed:
+            return
+        renamed.append(True)
+        with get_session() as session:
+            period = session.get(HistoricalPeriod, period_id)
+            assert period is not None
+            period.name = "Tarumanagara"
+            session.commit()
+
+    event.listen(ENGINE, "after_cursor_execute", rename_after_read)
+    try:
+        stale = get_historical_period(period_id)
+    finally:
+        event.remove(ENGINE, "after_cursor_execute", rename_after_read)
+    assert stale is not None
+    assert stale.name == "Kerajaan Tarumanegara"
+
+    fresh = get_historical_period(period_id)
+    assert fresh is not None
+    assert fresh.name == "Tarumanagara"
+
+
+def test_rolled_back_write_keeps_cache(reference_cache, statements):
+    with get_session() as session:
+        session.add(make_badge("penjelajah"))
+        session.commit()
+    list_active_badges()
+
+    with get_session() as session:
+        session.add(make_badge("cendekia"))
+        session.flush()
+        session.rollback()
+
+    statements.clear()
+    assert [badge.name for badge in list_active_badges()] == ["penjelajah"]
+    assert statements == []